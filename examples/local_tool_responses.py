@@ -16,16 +16,68 @@ Example:
         return {"temperature": 22, "unit": unit, "location": location}
 """
 
-from typing import Any, Callable, Dict, Optional
-import functools
+from typing import Any, Callable, Dict, List, Optional
 import logging
 import asyncio
-from time import sleep
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import types
 
 logger = logging.getLogger(__name__)
 
+# Set LIGHTBERRY_QUIET=1 to silence the console output of the tools below
+_QUIET = os.environ.get("LIGHTBERRY_QUIET") == "1"
+_stdout_write = sys.stdout.write
+
+class _WrappedDoc:
+    """__doc__ of the wrapped function on a Tool, the class docstring on Tool itself."""
+    
+    def __init__(self, class_doc: Optional[str]):
+        self.class_doc = class_doc
+        
+    def __get__(self, obj, objtype=None):
+        return self.class_doc if obj is None else obj.func.__doc__
+
+
+class Tool:
+    """A registered tool: its name, description and the function it calls."""
+    
+    __slots__ = ("name", "description", "func", "is_coroutine", "__name__", "__wrapped__")
+    __doc__ = _WrappedDoc(__doc__)
+    
+    def __init__(self, name: str, description: str, func: Callable):
+        self.name = name
+        self.description = description
+        self.func = func
+        # Whether calling the tool returns an awaitable
+        self.is_coroutine = asyncio.iscoroutinefunction(func)
+        # Look like the wrapped function to introspection (help, inspect.signature)
+        self.__name__ = getattr(func, "__name__", name)
+        self.__wrapped__ = func
+        
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+
 # Registry to store all available tools
-TOOL_REGISTRY: Dict[str, Callable] = {}
+TOOL_REGISTRY: Dict[str, Tool] = {}
+
+# Read-only view of the registry for external callers
+PUBLIC_TOOL_REGISTRY = types.MappingProxyType(TOOL_REGISTRY)
+
+# Bound lookup used by dispatch()
+_dispatch = TOOL_REGISTRY.get
+
+# Tools declared with @tool; register_all() moves them into TOOL_REGISTRY
+_DECLARED_TOOLS: List[Tool] = []
+_registered_count = 0
+
+# Snapshot returned by get_available_tools(), rebuilt after registration
+_tools_metadata_cache: Optional[Dict[str, Dict[str, Any]]] = None
 
 # Global reference to allow tools to control the application
 _app_controller = None
@@ -40,6 +92,9 @@ def tool(name: str, description: Optional[str] = None):
     """
     Decorator to register a function as a tool that can be called remotely.
     
+    The decorated name is bound to a Tool, which can still be called like the
+    original function. Tools are only added to TOOL_REGISTRY by register_all().
+    
     Args:
         name: The name that will be used to invoke this tool
         description: Optional description of what the tool does
@@ -49,46 +104,69 @@ def tool(name: str, description: Optional[str] = None):
         def calculate(operation: str, a: float, b: float) -> float:
             ...
     """
-    def decorator(func: Callable) -> Callable:
-        # Store metadata with the function
-        func._tool_name = name
-        func._tool_description = description or func.__doc__ or "No description available"
-        
-        # Register the function
-        TOOL_REGISTRY[name] = func
-        logger.info(f"Registered tool '{name}': {func._tool_description}")
-        
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                logger.debug(f"Executing tool '{name}' with args={args}, kwargs={kwargs}")
-                result = func(*args, **kwargs)
-                logger.debug(f"Tool '{name}' completed successfully")
-                return result
-            except Exception as e:
-                logger.error(f"Error executing tool '{name}': {e}")
-                raise
-                
-        return wrapper
+    def decorator(func: Callable) -> Tool:
+        t = Tool(name, description or func.__doc__ or "No description available", func)
+        _DECLARED_TOOLS.append(t)
+        return t
     return decorator
 
 
-def get_available_tools() -> Dict[str, Dict[str, Any]]:
+def register_all() -> None:
+    """Register all declared tools in TOOL_REGISTRY. Safe to call repeatedly."""
+    global _tools_metadata_cache, _registered_count
+    if _registered_count == len(_DECLARED_TOOLS):
+        return
+    
+    for t in _DECLARED_TOOLS[_registered_count:]:
+        TOOL_REGISTRY[t.name] = t
+        logger.info("Registered tool '%s': %s", t.name, t.description)
+    _registered_count = len(_DECLARED_TOOLS)
+    _tools_metadata_cache = None
+
+
+def get_available_tools(copy: bool = False) -> Dict[str, Dict[str, Any]]:
     """
     Get information about all registered tools.
     
+    Registers any declared tools first. The metadata is built once and cached
+    until another tool is registered.
+    
+    Args:
+        copy: Return a copy that is safe to mutate instead of the shared cache
+        
     Returns:
         Dictionary mapping tool names to their metadata
     """
-    tools = {}
-    for name, func in TOOL_REGISTRY.items():
-        tools[name] = {
-            "name": name,
-            "description": getattr(func, '_tool_description', 'No description'),
-            "function": func.__name__,
-            "module": func.__module__
+    global _tools_metadata_cache
+    register_all()
+    if _tools_metadata_cache is None:
+        _tools_metadata_cache = {
+            name: {
+                "name": name,
+                "description": t.description,
+                "function": t.func.__name__,
+                "module": t.func.__module__
+            }
+            for name, t in TOOL_REGISTRY.items()
         }
-    return tools
+    if copy:
+        return {name: dict(info) for name, info in _tools_metadata_cache.items()}
+    return _tools_metadata_cache
+
+
+def dispatch(name: str, *args, **kwargs) -> Any:
+    """
+    Call a registered tool by name.
+    
+    Registers any declared tools first, so it works before get_available_tools()
+    has been called.
+    
+    Returns:
+        The tool's result, or None if no tool is registered under that name
+    """
+    register_all()
+    func = _dispatch(name)
+    return func(*args, **kwargs) if func else None
 
 
 # ============== User Tool Definitions ==============
@@ -129,7 +207,8 @@ def add_to_order(
     
     # Print the order details
     special_text = f" with {special_instructions}" if special_instructions else ""
-    print(f"☕ Adding to order: {quantity}x {size} {coffee_type} with {milk_type} milk{special_text}")
+    if not _QUIET:
+        _stdout_write(f"☕ Adding to order: {quantity}x {size} {coffee_type} with {milk_type} milk{special_text}\n")
     
     return {
         "tool": "add_to_order",
@@ -149,7 +228,8 @@ def add_to_order(
 def get_current_order() -> Dict[str, Any]:
     """Get the current coffee order."""
     
-    print("📋 Getting current coffee order")
+    if not _QUIET:
+        _stdout_write("📋 Getting current coffee order\n")
     
     return {
         "tool": "get_current_order",
@@ -171,23 +251,20 @@ def amend_order(
 ) -> Dict[str, Any]:
     """Modify or remove an item from the current order."""
     
-    if action == "remove":
-        print(f"🗑️ Removing item {item_id} from order")
-    else:
-        changes = []
-        if coffee_type:
-            changes.append(f"coffee type: {coffee_type}")
-        if milk_type:
-            changes.append(f"milk type: {milk_type}")
-        if size:
-            changes.append(f"size: {size}")
-        if quantity > 0:
-            changes.append(f"quantity: {quantity}")
-        if special_instructions:
-            changes.append(f"special instructions: {special_instructions}")
-        
-        changes_text = ", ".join(changes) if changes else "no changes"
-        print(f"✏️ Amending order item {item_id}: {changes_text}")
+    if not _QUIET:
+        if action == "remove":
+            _stdout_write(f"🗑️ Removing item {item_id} from order\n")
+        else:
+            changes_text = ", ".join(
+                change for change in (
+                    coffee_type and f"coffee type: {coffee_type}",
+                    milk_type and f"milk type: {milk_type}",
+                    size and f"size: {size}",
+                    quantity > 0 and f"quantity: {quantity}",
+                    special_instructions and f"special instructions: {special_instructions}",
+                ) if change
+            ) or "no changes"
+            _stdout_write(f"✏️ Amending order item {item_id}: {changes_text}\n")
     
     return {
         "tool": "amend_order",
@@ -204,7 +281,8 @@ def send_order(customer_name: str = "", special_notes: str = "") -> Dict[str, An
     
     customer_text = f" for {customer_name}" if customer_name else ""
     notes_text = f" (Notes: {special_notes})" if special_notes else ""
-    print(f"🚀 Sending coffee order to robot{customer_text}{notes_text}")
+    if not _QUIET:
+        _stdout_write(f"🚀 Sending coffee order to robot{customer_text}{notes_text}\n")
     
     return {
         "tool": "send_order",
@@ -220,17 +298,47 @@ def send_order(customer_name: str = "", special_notes: str = "") -> Dict[str, An
 # Add tracking dictionary at module level for duplicate prevention
 _tool_call_tracker = {}
 
+# Joy messages for the dance button press and release
+_JOY_PRESS = {
+    "header": {
+        "seq": 0,
+        "stamp": {"secs": 0, "nsecs": 0},
+        "frame_id": "/dev/input/js0"
+    },
+    "axes": [0.0, 0.0, 0.0, 0.0, 0.0, -1.0, 0.0, 0.0],
+    "buttons": [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+}
+_JOY_RELEASE = dict(_JOY_PRESS, buttons=[0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+
+# rostopic commands for dance_tool, built once on first use
+_dance_press_cmd = None
+_dance_release_cmd = None
+
+
+def _build_dance_commands():
+    """Resolve rostopic and serialize the Joy press/release messages once."""
+    global _dance_press_cmd, _dance_release_cmd
+    
+    rostopic = shutil.which("rostopic")
+    if rostopic is None:
+        raise FileNotFoundError("rostopic")
+    
+    _dance_press_cmd = [
+        rostopic, "pub", "-1", "/joy_input", "sensor_msgs/Joy",
+        json.dumps(_JOY_PRESS)
+    ]
+    _dance_release_cmd = [
+        rostopic, "pub", "-1", "/joy_input", "sensor_msgs/Joy",
+        json.dumps(_JOY_RELEASE)
+    ]
+
+
 @tool(name="dance_tool", description="Trigger dance motion on robot by simulating joystick button press")
 async def dance_tool(**kwargs) -> Dict[str, Any]:
     """
     Async version that triggers dance motion without blocking the event loop.
     Uses subprocess for non-blocking rostopic calls.
     """
-    import subprocess
-    import json
-    import asyncio
-    import time
-    
     # Prevent duplicate calls within 1 second
     current_time = time.time()
     if 'dance_tool' in _tool_call_tracker:
@@ -250,27 +358,13 @@ async def dance_tool(**kwargs) -> Dict[str, Any]:
         print(f"🕺 Dance requested with params: {kwargs}")
     
     try:
-        # Create the Joy message for button press
-        joy_message_press = {
-            "header": {
-                "seq": 0,
-                "stamp": {"secs": 0, "nsecs": 0},
-                "frame_id": "/dev/input/js0"
-            },
-            "axes": [0.0, 0.0, 0.0, 0.0, 0.0, -1.0, 0.0, 0.0],
-            "buttons": [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-        }
+        if _dance_press_cmd is None:
+            _build_dance_commands()
         
         # Publish button press using subprocess (non-blocking)
         print("🕺 Triggering dance motion - button press")
-        cmd_press = [
-            "rostopic", "pub", "-1", "/joy_input", "sensor_msgs/Joy",
-            json.dumps(joy_message_press)
-        ]
-        
-        # Use Popen for non-blocking execution
         process_press = subprocess.Popen(
-            cmd_press, 
+            _dance_press_cmd, 
             stdout=subprocess.PIPE, 
             stderr=subprocess.PIPE
         )
@@ -278,19 +372,11 @@ async def dance_tool(**kwargs) -> Dict[str, Any]:
         # Wait 200ms asynchronously (doesn't block event loop)
         await asyncio.sleep(0.2)
         
-        # Create release message
-        joy_message_release = joy_message_press.copy()
-        joy_message_release["buttons"] = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-        
         print("🕺 Dance motion triggered - button released")
-        cmd_release = [
-            "rostopic", "pub", "-1", "/joy_input", "sensor_msgs/Joy",
-            json.dumps(joy_message_release)
-        ]
         
         # Send release command (non-blocking)
         process_release = subprocess.Popen(
-            cmd_release,
+            _dance_release_cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
@@ -322,13 +408,16 @@ async def dance_tool(**kwargs) -> Dict[str, Any]:
 # ============== Session Control Tools ==============
 
 @tool(name="end_session", description="End the current conversation session")
-def end_session(farewell_message: str) -> Dict[str, Any]:
+async def end_session(farewell_message: str) -> Dict[str, Any]:
     """End the current conversation session and disconnect from the room."""
     
     print("Received end session message. Letting audio play.")
     print(f"👋 {farewell_message}")
-    sleeplength = len(farewell_message)/13 + 2 #approximation + buffer
-    sleep(sleeplength)
+    sleeplength = len(farewell_message)/13 + 2 #approximation + buffer, used as an upper bound
+    if _app_controller is not None and hasattr(_app_controller, "wait_for_audio_drain"):
+        await _app_controller.wait_for_audio_drain(sleeplength)
+    else:
+        await asyncio.sleep(sleeplength)
     print("🔌 Disconnecting from LiveKit room...")
     
     # Signal the application to disconnect
@@ -19,7 +19,7 @@ import logging
 import os
 from datetime import datetime
 from lightberry_ai import LBToolClient
-from local_tool_responses import TOOL_REGISTRY, set_app_controller
+from local_tool_responses import get_available_tools, set_app_controller
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -94,11 +94,11 @@ Remember: These instructions apply only to this session.
     set_app_controller(client)
     
     # Display available tools
-    if TOOL_REGISTRY:
+    tools = get_available_tools()
+    if tools:
         print("\n📦 Available tools for this session:")
-        for tool_name, tool_func in TOOL_REGISTRY.items():
-            description = getattr(tool_func, '_tool_description', 'No description')
-            print(f"  • {tool_name}: {description}")
+        for tool_name, info in tools.items():
+            print(f"  • {tool_name}: {info['description']}")
         print()
     
     try:
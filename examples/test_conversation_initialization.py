@@ -4,24 +4,145 @@ Test example for conversation initialization with transcript history.
 
 This example demonstrates how to initialize a conversation with existing transcripts,
 bypassing the welcome message and continuing from a specific conversation state.
+
+Pass --connect-only to authenticate each client and skip audio streaming, as a
+quick smoke test of configuration and credentials.
 """
 
 import asyncio
+import logging
+import logging.handlers
 import os
+import queue
 import sys
-from dotenv import load_dotenv
 
-# Add the parent package to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import aiohttp
+
+# Add the parent package to path for imports (once, even if imported repeatedly)
+_PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PACKAGE_ROOT not in sys.path:
+    sys.path.insert(0, _PACKAGE_ROOT)
 
+# Importing the SDK loads .env
 from lightberry_ai import LBBasicClient, LBToolClient
 
-load_dotenv()
+# Credentials from environment, read once for all tests
+API_KEY = os.environ.get("LIGHTBERRY_API_KEY")
+DEVICE_ID = os.environ.get("DEVICE_ID")
 
-async def test_basic_client_with_history():
-    """Test LBBasicClient with initial transcript history."""
+BANNER = "=" * 50
+
+# Only authenticate; skip the audio streaming phase of each test
+CONNECT_ONLY = "--connect-only" in sys.argv[1:]
+
+# Tests connect concurrently but take turns on the audio device; created in main()
+_audio_lock = None
+
+# Test output is queued and written to stdout by a listener thread started in main()
+_log_queue = queue.SimpleQueue()
+log = logging.getLogger("lbtest")
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+
+class _TestOutput:
+    """Buffers a test's output until it owns the audio device, then prints live."""
+    
+    def __init__(self):
+        self._lines = []
+        self._live = False
     
-    print("=== Testing LBBasicClient with Initial Transcripts ===")
+    def __call__(self, line=""):
+        if self._live:
+            log.info(line)
+        else:
+            self._lines.append(line)
+    
+    def go_live(self):
+        if self._lines:
+            log.info("\n".join(self._lines))
+            self._lines.clear()
+        self._live = True
+
+async def _run_client_test(
+    title,
+    client_cls,
+    http_session,
+    cleanup_tasks,
+    *,
+    initial_transcripts=None,
+    expectations=(),
+    extra_props=(),
+    duration=30,
+    purpose,
+):
+    """Connect a client, report its state, then stream audio for a fixed time."""
+    
+    out = _TestOutput()
+    out(title)
+    
+    if not API_KEY or not DEVICE_ID:
+        out("❌ Error: LIGHTBERRY_API_KEY and DEVICE_ID must be set in .env file")
+        out.go_live()
+        return False
+    
+    client = client_cls(
+        api_key=API_KEY,
+        device_id=DEVICE_ID,
+        http_session=http_session,
+        initial_transcripts=initial_transcripts,
+        log_level="INFO"
+    )
+    
+    try:
+        out("🔗 Connecting to Lightberry service...")
+        await client.connect()
+        
+        report = [f"✅ Connected! Room: {client.room_name}"]
+        if initial_transcripts:
+            report.append(f"📝 Client initialized with {len(initial_transcripts)} transcript messages")
+        else:
+            report.append("💬 No initial transcripts provided")
+        report.extend(f"{prop}: {getattr(client, prop)}" for prop in extra_props)
+        report.extend(expectations)
+        out("\n".join(report))
+        
+        if CONNECT_ONLY:
+            out("⏭️ Skipping audio streaming (--connect-only)")
+            return True
+        
+        out(f"\n⏳ Starting audio streaming for {duration} seconds to {purpose}...")
+        
+        async with _audio_lock:
+            out.go_live()
+            # This will run for a short time to test the conversation flow
+            audio_task = asyncio.create_task(client.enable_audio())
+            
+            # Wait for the test duration or until interrupted
+            try:
+                await asyncio.wait_for(audio_task, timeout=duration)
+            except asyncio.TimeoutError:
+                out(f"⏰ Test completed ({duration} seconds elapsed)")
+            
+        return True
+        
+    except KeyboardInterrupt:
+        out("\n🛑 Test interrupted by user")
+        return True
+    except Exception as e:
+        out(f"❌ Test failed: {e}")
+        return False
+    finally:
+        out.go_live()
+        # Nothing to tear down if connect() failed
+        if client.is_connected:
+            # Tear down in the background; main() waits for it after the summary
+            cleanup_tasks.append(asyncio.create_task(client.disconnect()))
+            out("🔌 Disconnecting")
+
+async def test_basic_client_with_history(http_session, cleanup_tasks):
+    """Test LBBasicClient with initial transcript history."""
     
     # Sample conversation history
     initial_transcripts = [
@@ -47,61 +168,24 @@ async def test_basic_client_with_history():
         }
     ]
     
-    # Get credentials from environment
-    api_key = os.getenv("LIGHTBERRY_API_KEY")
-    device_id = os.getenv("DEVICE_ID")
-    
-    if not api_key or not device_id:
-        print("❌ Error: LIGHTBERRY_API_KEY and DEVICE_ID must be set in .env file")
-        return False
-    
-    # Create client with initial transcripts
-    client = LBBasicClient(
-        api_key=api_key,
-        device_id=device_id,
+    return await _run_client_test(
+        "=== Testing LBBasicClient with Initial Transcripts ===",
+        LBBasicClient,
+        http_session,
+        cleanup_tasks,
         initial_transcripts=initial_transcripts,
-        log_level="INFO"
+        expectations=(
+            "🎤 The conversation should continue from where we left off...",
+            "Expected: The assistant should not give a welcome greeting",
+            "Expected: The conversation should continue as if we're in the middle of ordering coffee",
+        ),
+        duration=30,
+        purpose="test conversation continuation",
     )
-    
-    try:
-        print("🔗 Connecting to Lightberry service...")
-        await client.connect()
-        
-        print(f"✅ Connected! Room: {client.room_name}")
-        print(f"📝 Client initialized with {len(initial_transcripts)} transcript messages")
-        print("🎤 The conversation should continue from where we left off...")
-        print("Expected: The assistant should not give a welcome greeting")
-        print("Expected: The conversation should continue as if we're in the middle of ordering coffee")
-        
-        # Give a brief moment to see any immediate responses
-        print("\n⏳ Starting audio streaming for 30 seconds to test conversation continuation...")
-        
-        # This will run for a short time to test the conversation flow
-        audio_task = asyncio.create_task(client.enable_audio())
-        
-        # Wait for 30 seconds or until interrupted
-        try:
-            await asyncio.wait_for(audio_task, timeout=30.0)
-        except asyncio.TimeoutError:
-            print("⏰ Test completed (30 seconds elapsed)")
-            
-        return True
-        
-    except KeyboardInterrupt:
-        print("\n🛑 Test interrupted by user")
-        return True
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        return False
-    finally:
-        await client.disconnect()
-        print("🔌 Disconnected")
 
-async def test_tool_client_with_history():
+async def test_tool_client_with_history(http_session, cleanup_tasks):
     """Test LBToolClient with initial transcript history."""
     
-    print("\n=== Testing LBToolClient with Initial Transcripts ===")
-    
     # Sample conversation history with tool interaction
     initial_transcripts = [
         {
@@ -116,140 +200,121 @@ async def test_tool_client_with_history():
         },
     ]
     
-    # Get credentials from environment
-    api_key = os.getenv("LIGHTBERRY_API_KEY")
-    device_id = os.getenv("DEVICE_ID")
-    
-    if not api_key or not device_id:
-        print("❌ Error: LIGHTBERRY_API_KEY and DEVICE_ID must be set in .env file")
-        return False
-    
-    # Create tool client with initial transcripts
-    client = LBToolClient(
-        api_key=api_key,
-        device_id=device_id,
+    return await _run_client_test(
+        "\n=== Testing LBToolClient with Initial Transcripts ===",
+        LBToolClient,
+        http_session,
+        cleanup_tasks,
         initial_transcripts=initial_transcripts,
-        log_level="INFO"
+        expectations=(
+            "🛠️ The conversation should continue with tool capabilities...",
+            "Expected: The assistant should not give a welcome greeting",
+            "Expected: The conversation should continue as if we're discussing smart home controls",
+        ),
+        extra_props=("data_channel_name",),
+        duration=30,
+        purpose="test tool integration",
     )
-    
-    try:
-        print("🔗 Connecting to Lightberry service...")
-        await client.connect()
-        
-        print(f"✅ Connected! Room: {client.room_name}")
-        print(f"📝 Client initialized with {len(initial_transcripts)} transcript messages")
-        print("🛠️ The conversation should continue with tool capabilities...")
-        print("Expected: The assistant should not give a welcome greeting")
-        print("Expected: The conversation should continue as if we're discussing smart home controls")
-        
-        print("\n⏳ Starting audio streaming for 30 seconds to test tool integration...")
-        
-        # This will run for a short time to test the conversation flow
-        audio_task = asyncio.create_task(client.enable_audio())
-        
-        # Wait for 30 seconds or until interrupted
-        try:
-            await asyncio.wait_for(audio_task, timeout=30.0)
-        except asyncio.TimeoutError:
-            print("⏰ Test completed (30 seconds elapsed)")
-            
-        return True
-        
-    except KeyboardInterrupt:
-        print("\n🛑 Test interrupted by user")
-        return True
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        return False
-    finally:
-        await client.disconnect()
-        print("🔌 Disconnected")
 
-async def test_no_transcripts():
+async def test_no_transcripts(http_session, cleanup_tasks):
     """Test normal behavior without initial transcripts (should give welcome message)."""
     
-    print("\n=== Testing Normal Behavior (No Initial Transcripts) ===")
-    
-    # Get credentials from environment
-    api_key = os.getenv("LIGHTBERRY_API_KEY")
-    device_id = os.getenv("DEVICE_ID")
-    
-    if not api_key or not device_id:
-        print("❌ Error: LIGHTBERRY_API_KEY and DEVICE_ID must be set in .env file")
-        return False
-    
-    # Create client WITHOUT initial transcripts
-    client = LBBasicClient(
-        api_key=api_key,
-        device_id=device_id,
-        # No initial_transcripts parameter - should use default welcome flow
-        log_level="INFO"
+    # No initial_transcripts - should use default welcome flow
+    return await _run_client_test(
+        "\n=== Testing Normal Behavior (No Initial Transcripts) ===",
+        LBBasicClient,
+        http_session,
+        cleanup_tasks,
+        expectations=(
+            "Expected: The assistant should give a normal welcome greeting",
+        ),
+        duration=15,
+        purpose="verify normal welcome flow",
     )
-    
-    try:
-        print("🔗 Connecting to Lightberry service...")
-        await client.connect()
-        
-        print(f"✅ Connected! Room: {client.room_name}")
-        print("💬 No initial transcripts provided")
-        print("Expected: The assistant should give a normal welcome greeting")
-        
-        print("\n⏳ Starting audio streaming for 15 seconds to verify normal welcome flow...")
-        
-        # This will run for a short time to test the normal flow
-        audio_task = asyncio.create_task(client.enable_audio())
-        
-        # Wait for 15 seconds or until interrupted
-        try:
-            await asyncio.wait_for(audio_task, timeout=15.0)
-        except asyncio.TimeoutError:
-            print("⏰ Test completed (15 seconds elapsed)")
-            
-        return True
-        
-    except KeyboardInterrupt:
-        print("\n🛑 Test interrupted by user")
-        return True
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        return False
-    finally:
-        await client.disconnect()
-        print("🔌 Disconnected")
 
 async def main():
     """Run all tests."""
-    print("🧪 Conversation Initialization Feature Tests")
-    print("=" * 50)
-    
-    results = []
-    
-    # Test 1: Basic client with history
-    results.append(await test_basic_client_with_history())
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(_log_queue, handler)
+    listener.start()
+    try:
+        return await _run_tests()
+    finally:
+        # Stopping the listener flushes any queued output
+        listener.stop()
+
+async def _run_tests():
+    """Run the tests concurrently and log a summary."""
+    loop_module = type(asyncio.get_running_loop()).__module__.split(".")[0]
+    log.info(f"🧪 Conversation Initialization Feature Tests (event loop: {loop_module})\n{BANNER}")
     
-    # Test 2: Tool client with history  
-    results.append(await test_tool_client_with_history())
+    global _audio_lock
+    _audio_lock = asyncio.Lock()
     
-    # Test 3: Normal behavior (control test)
-    results.append(await test_no_transcripts())
+    # Connect all clients at once over one pooled HTTP session; audio
+    # streaming still runs one test at a time
+    cleanup_tasks = []
+    connector = aiohttp.TCPConnector(limit=8)
+    async with aiohttp.ClientSession(connector=connector) as http_session:
+        outcomes = await asyncio.gather(
+            test_basic_client_with_history(http_session, cleanup_tasks),  # Test 1: Basic client with history
+            test_tool_client_with_history(http_session, cleanup_tasks),   # Test 2: Tool client with history
+            test_no_transcripts(http_session, cleanup_tasks),             # Test 3: Normal behavior (control test)
+            return_exceptions=True,
+        )
+    # Errors raised outside a test's own try block (e.g. in its finally) are
+    # returned here rather than printed, so report them before the summary
+    for number, outcome in enumerate(outcomes, 1):
+        if isinstance(outcome, Exception):
+            log.error(f"❌ Test {number} raised {type(outcome).__name__}: {outcome}", exc_info=outcome)
+    results = [outcome is True for outcome in outcomes]
     
     # Summary
-    print("\n" + "=" * 50)
-    print("🏁 Test Summary:")
-    print(f"✅ Passed: {sum(results)}/{len(results)} tests")
+    log.info(
+        f"\n{BANNER}\n"
+        "🏁 Test Summary:\n"
+        f"✅ Passed: {sum(results)}/{len(results)} tests"
+    )
     
     if all(results):
-        print("🎉 All tests completed successfully!")
-        print("\n📋 Manual Verification Checklist:")
-        print("  □ No welcome greeting when using initial transcripts")
-        print("  □ Conversation continues from provided history")
-        print("  □ Real-time transcript sync via data channel")
-        print("  □ Normal welcome greeting when no transcripts provided")
-        print("  □ Tool functionality works with transcript history")
+        log.info(
+            "🎉 All tests completed successfully!\n"
+            "\n📋 Manual Verification Checklist:\n"
+            "  □ No welcome greeting when using initial transcripts\n"
+            "  □ Conversation continues from provided history\n"
+            "  □ Real-time transcript sync via data channel\n"
+            "  □ Normal welcome greeting when no transcripts provided\n"
+            "  □ Tool functionality works with transcript history"
+        )
     else:
-        print("❌ Some tests failed. Check the output above for details.")
+        log.info("❌ Some tests failed. Check the output above for details.")
+    
+    # Let the background disconnects finish
+    await asyncio.gather(*cleanup_tasks, return_exceptions=True)
     
     return all(results)
 
+def run_all(runner=None):
+    """
+    Run the test suite to completion from synchronous code.
+    
+    Args:
+        runner: Optional asyncio.Runner (Python 3.11+) whose event loop is reused
+            across calls; without one, a fresh loop is created with asyncio.run()
+    
+    Returns:
+        True if every test passed
+    """
+    if runner is not None:
+        return runner.run(main())
+    return asyncio.run(main())
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Importing lightberry_ai already selects uvloop when it is installed
+    # (set LB_USE_UVLOOP=0 to compare against the default asyncio loop)
+    if hasattr(asyncio, "Runner"):
+        with asyncio.Runner() as runner:
+            run_all(runner)
+    else:
+        run_all()
\ No newline at end of file
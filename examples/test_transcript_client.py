@@ -12,18 +12,15 @@ interface for testing transcript initialization functionality.
 import asyncio
 import os
 import json
-from dotenv import load_dotenv
+# Importing the SDK loads .env
 from lightberry_ai import LBBasicClient
 
 async def main():
     """Test transcript client with environment variable support."""
     
-    # Load environment variables
-    load_dotenv()
-    
     # Get credentials from environment
-    api_key = os.getenv("LIGHTBERRY_API_KEY")
-    device_id = os.getenv("DEVICE_ID")
+    api_key = os.environ.get("LIGHTBERRY_API_KEY")
+    device_id = os.environ.get("DEVICE_ID")
     
     if not api_key or not device_id:
         print("Error: LIGHTBERRY_API_KEY and DEVICE_ID must be set in .env file")
@@ -31,7 +28,7 @@ async def main():
     
     # Check for initial transcripts from environment (for testing)
     initial_transcripts = None
-    initial_transcripts_json = os.getenv("INITIAL_TRANSCRIPTS")
+    initial_transcripts_json = os.environ.get("INITIAL_TRANSCRIPTS")
     if initial_transcripts_json:
         try:
             initial_transcripts = json.loads(initial_transcripts_json)
@@ -5,8 +5,17 @@ This SDK provides class-based clients for audio streaming and tool execution
 using LiveKit infrastructure.
 """
 
+from ._env import ensure_loaded
+from ._runtime import install_event_loop_policy
+
+# Load .env once, before any submodule reads its configuration; LB_USE_UVLOOP
+# may come from it
+ensure_loaded()
+install_event_loop_policy()
+
+from .auth.errors import QuotaExceededError
 from .core.basic_client import LBBasicClient
 from .core.tool_client import LBToolClient
 
 __version__ = "0.1.0"
-__all__ = ["LBBasicClient", "LBToolClient"]
\ No newline at end of file
+__all__ = ["LBBasicClient", "LBToolClient", "QuotaExceededError"]
\ No newline at end of file
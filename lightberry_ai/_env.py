@@ -0,0 +1,29 @@
+"""
+Environment loading for Lightberry SDK
+
+Loads the nearest .env file (searching upward from the working directory) at
+most once per process. The _LB_DOTENV_LOADED environment variable marks a
+file as loaded, so child processes (which inherit the values) skip it.
+"""
+
+import os
+
+_SENTINEL = "_LB_DOTENV_LOADED"
+
+_loaded = False
+
+
+def ensure_loaded() -> None:
+    """Load environment variables from the nearest .env on first call, if one exists."""
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+    
+    if os.environ.get(_SENTINEL):
+        return
+    
+    from dotenv import find_dotenv, load_dotenv
+    env_path = find_dotenv(usecwd=True)
+    if env_path and load_dotenv(env_path):
+        os.environ[_SENTINEL] = "1"
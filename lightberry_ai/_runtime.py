@@ -0,0 +1,36 @@
+"""
+Event loop setup for Lightberry SDK
+
+Switches asyncio to uvloop when it is installed, which lowers wakeup latency
+for the 10ms audio frame loop and the tool-call handlers. Set LB_USE_UVLOOP=0
+to keep the default asyncio event loop. A policy the application has already
+installed is left alone.
+"""
+
+import asyncio
+import os
+import sys
+
+_installed = False
+
+
+def install_event_loop_policy() -> None:
+    """Install the uvloop event loop policy once, if enabled, available and nothing else is set."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    
+    if sys.platform == "win32":
+        return
+    if os.environ.get("LB_USE_UVLOOP", "1").lower() in ("0", "false", "no", "off"):
+        return
+    # Don't override a policy chosen by the application (or another library)
+    if type(asyncio.get_event_loop_policy()) is not asyncio.DefaultEventLoopPolicy:
+        return
+    
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -2,8 +2,9 @@
 Authentication utilities for Lightberry SDK
 """
 
-from .authenticator import authenticate
+from .authenticator import authenticate, close_auth_session, release_auth_session, retain_auth_session
+from .errors import QuotaExceededError
 from .local_authenticator import authenticate_local
 from .custom_authenticator import get_token_from_custom_server
 
-__all__ = ["authenticate", "authenticate_local", "get_token_from_custom_server"]
\ No newline at end of file
+__all__ = ["authenticate", "close_auth_session", "retain_auth_session", "release_auth_session", "QuotaExceededError", "authenticate_local", "get_token_from_custom_server"]
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Credential cache for Lightberry SDK authentication
+
+Keeps the (token, room_name, livekit_url) tuple returned by the auth API so
+that reconnecting within the same process does not repeat the HTTP round-trip.
+Entries live until the token's own ``exp`` claim. While a connected client is
+using an entry it is held, and is not handed to another client, which would
+join under the same participant identity and evict the first.
+"""
+
+import base64
+import json
+import time
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+# Lifetime assumed for tokens that carry no readable exp claim
+AUTH_CACHE_TTL = 600.0  # seconds
+# Cached credentials are treated as stale this long before they expire
+EXPIRY_MARGIN = 30.0  # seconds
+
+_AUTH_CACHE: Dict[Hashable, Tuple[str, str, str, float]] = {}
+
+# Keys whose credentials a connected client is currently using
+_HELD: Set[Hashable] = set()
+
+
+def checkout_credentials(key: Hashable) -> Optional[Tuple[str, str, str]]:
+    """
+    Look up unexpired credentials and hold them for the caller.
+    
+    Args:
+        key: Cache key describing the authentication request
+    
+    Returns:
+        Tuple of (token, room_name, livekit_url), or None if absent, about to
+        expire, or held by another client
+    """
+    if key in _HELD:
+        return None
+    entry = _AUTH_CACHE.get(key)
+    if entry is None:
+        return None
+    token, room_name, livekit_url, expiry = entry
+    if time.monotonic() < expiry - EXPIRY_MARGIN:
+        _HELD.add(key)
+        return token, room_name, livekit_url
+    del _AUTH_CACHE[key]
+    return None
+
+
+def token_ttl(token: str, default: float = AUTH_CACHE_TTL) -> float:
+    """
+    Seconds until a JWT expires, read from its ``exp`` claim.
+    
+    The signature is not verified; the claim is only used to decide how long
+    the token is worth caching.
+    
+    Args:
+        token: JWT access token
+        default: Value returned when the token has no readable exp claim
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"]) - time.time()
+    except (IndexError, KeyError, TypeError, ValueError):
+        return default
+
+
+def cache_credentials(key: Hashable, credentials: Tuple[str, str, str], ttl: Optional[float] = None) -> bool:
+    """
+    Store freshly fetched credentials for reuse and hold them for the caller.
+    
+    Args:
+        key: Cache key describing the authentication request
+        credentials: Tuple of (token, room_name, livekit_url)
+        ttl: Seconds until the credentials should no longer be reused
+            (default: until the token's exp claim)
+    
+    Returns:
+        False if another client holds the key, in which case nothing is stored
+    """
+    if key in _HELD:
+        return False
+    token, room_name, livekit_url = credentials
+    if ttl is None:
+        ttl = token_ttl(token)
+    _AUTH_CACHE[key] = (token, room_name, livekit_url, time.monotonic() + ttl)
+    _HELD.add(key)
+    return True
+
+
+def release_credentials(key: Hashable) -> None:
+    """Stop holding credentials; they stay cached for the next connect."""
+    _HELD.discard(key)
+
+
+def invalidate_credentials(key: Hashable) -> None:
+    """Drop cached credentials for a key, if any."""
+    _AUTH_CACHE.pop(key, None)
@@ -0,0 +1,26 @@
+"""
+HTTP session helpers for Lightberry SDK authentication
+"""
+
+import contextlib
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+
+@contextlib.asynccontextmanager
+async def session_scope(http_session: Optional[aiohttp.ClientSession] = None) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Provide an aiohttp session for one request.
+    
+    Args:
+        http_session: Caller-owned session to reuse; it is left open
+    
+    Yields:
+        The caller's session, or a temporary one that is closed on exit
+    """
+    if http_session is not None:
+        yield http_session
+        return
+    async with aiohttp.ClientSession() as session:
+        yield session
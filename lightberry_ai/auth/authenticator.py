@@ -6,13 +6,18 @@ Handles authentication with Lightberry API service and fallback to local token g
 
 import os
 import json
+import asyncio
 import aiohttp
 import logging
-from typing import Optional, Tuple
-from dotenv import load_dotenv
+from typing import Dict, Optional, Tuple
 
-# Load environment variables from .env file
-load_dotenv()
+from .errors import QuotaExceededError
+
+# orjson is optional (the "fast" extra); fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Get LiveKit credentials from environment variables
 DEVICE_ID = os.environ.get("DEVICE_ID")
@@ -26,11 +31,80 @@ AUTH_API_URL = os.environ.get("AUTH_API_URL", "https://dashboard.lightberry.com/
 
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Shared HTTP sessions for auth API requests, one per event loop, created on
+# first use. Clients retain/release them (counted per loop) so that one client
+# disconnecting does not close a session another client is still using.
+_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+_session_users: Dict[asyncio.AbstractEventLoop, int] = {}
+
+
+async def _close_session(session: aiohttp.ClientSession) -> None:
+    """Close a session, tolerating one whose event loop has already shut down."""
+    if session.closed:
+        return
+    try:
+        await session.close()
+    except RuntimeError as e:
+        logger.debug("Error closing auth session from a closed event loop: %s", e)
+
+
+async def _prune_sessions() -> None:
+    """Close sessions left behind by event loops that have since been closed."""
+    for loop in [loop for loop in _session_users if loop.is_closed()]:
+        del _session_users[loop]
+    for loop in [loop for loop in _sessions if loop.is_closed()]:
+        await _close_session(_sessions.pop(loop))
 
 
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared auth API session for the running loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=4, ttl_dns_cache=300, keepalive_timeout=60)
+        session = aiohttp.ClientSession(connector=connector)
+        # Stored before awaiting so that concurrent first calls share it
+        _sessions[loop] = session
+        await _prune_sessions()
+    return session
 
 
-async def get_credentials_from_api(participant_name: str, assistant_name: Optional[str] = None, has_initial_transcripts: bool = False, session_instructions: Optional[str] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+def retain_auth_session() -> None:
+    """Register a user of the running loop's shared auth API session."""
+    loop = asyncio.get_running_loop()
+    _session_users[loop] = _session_users.get(loop, 0) + 1
+
+
+async def release_auth_session() -> None:
+    """Drop a user of the running loop's shared auth API session, closing it once nothing uses it."""
+    loop = asyncio.get_running_loop()
+    users = _session_users.pop(loop, 0) - 1
+    if users > 0:
+        _session_users[loop] = users
+    else:
+        await close_auth_session()
+
+
+async def close_auth_session() -> None:
+    """Close the shared auth API session for the running loop, and any orphaned ones."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await _close_session(session)
+    await _prune_sessions()
+
+
+async def get_credentials_from_api(participant_name: str, assistant_name: Optional[str] = None, has_initial_transcripts: bool = False, session_instructions: Optional[str] = None, http_session: Optional[aiohttp.ClientSession] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Fetches LiveKit token, room name, and URL from the authentication API.
     
@@ -40,9 +114,13 @@ async def get_credentials_from_api(participant_name: str, assistant_name: Option
                        If multiple assistants with the same name exist, the first one found will be used.
         has_initial_transcripts: Whether the client has initial transcripts to send
         session_instructions: Optional instructions to append to the system prompt for this session only
+        http_session: Optional aiohttp session to use instead of the shared module session
     
     Returns:
         Tuple of (token, room_name, livekit_url) or (None, None, None) if failed
+    
+    Raises:
+        QuotaExceededError: If the API reports that the quota has been exceeded
     """
     if not DEVICE_ID:
         logger.error("DEVICE_ID not set in environment variables")
@@ -52,8 +130,7 @@ async def get_credentials_from_api(participant_name: str, assistant_name: Option
     
     # TODO: Add LIGHTBERRY_API_KEY to payload when server side is ready
     # Current payload format maintained for compatibility
-    api_key = LIGHTBERRY_API_KEY  # Reference API key for future use
-    payload = {"username": participant_name, "x-device-api-key": api_key}
+    payload = {"username": participant_name, "x-device-api-key": LIGHTBERRY_API_KEY}
     if assistant_name:
         payload["assistant_name"] = assistant_name
         logger.warning("⚠️  WARNING: Manually overwriting the assistant to a different one than is configured. Use this only for testing.")
@@ -63,35 +140,41 @@ async def get_credentials_from_api(participant_name: str, assistant_name: Option
     if session_instructions:
         payload["session_instructions"] = session_instructions
         logger.info("📋 Client has session instructions to send")
-    logger.info(f"Attempting to fetch credentials from {url} for username '{participant_name}', device_id '{DEVICE_ID}'{', assistant: ' + assistant_name if assistant_name else ''}")
+    logger.info("Attempting to fetch credentials from %s for username '%s', device_id '%s'%s", url, participant_name, DEVICE_ID, f", assistant: {assistant_name}" if assistant_name else "")
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                response.raise_for_status()
-                data = await response.json()
+        session = http_session if http_session is not None else await _get_session()
+        async with session.post(url, data=_json_dumps(payload), headers=_JSON_HEADERS, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 429:
+                raise QuotaExceededError("Quota exceeded (HTTP 429)")
+            response.raise_for_status()
+            data = _json_loads(await response.read())
+            
+            if data.get("success"):
+                token = data.get("livekit_token")
+                room_name = data.get("room_name")
+                livekit_url = data.get("livekit_url", DEFAULT_LIVEKIT_URL)  # Use fallback if not provided
                 
-                if data.get("success"):
-                    token = data.get("livekit_token")
-                    room_name = data.get("room_name")
-                    livekit_url = data.get("livekit_url", DEFAULT_LIVEKIT_URL)  # Use fallback if not provided
-                    
-                    if token and room_name:
-                        logger.info(f"Successfully retrieved credentials: {room_name}, URL: {livekit_url}")
-                        return token, room_name, livekit_url
-                    else:
-                        logger.error("API response missing token or room name.")
-                        return None, None, None
+                if token and room_name:
+                    logger.info("Successfully retrieved credentials: %s, URL: %s", room_name, livekit_url)
+                    return token, room_name, livekit_url
                 else:
-                    error_msg = data.get("error", "Unknown error")
-                    logger.error(f"API request failed: {error_msg}")
+                    logger.error("API response missing token or room name.")
                     return None, None, None
+            else:
+                error_msg = data.get("error", "Unknown error")
+                logger.error("API request failed: %s", error_msg)
+                if data.get("error_code") == "quota_exceeded":
+                    raise QuotaExceededError(error_msg)
+                return None, None, None
+    except QuotaExceededError:
+        raise
     except Exception as e:
-        logger.error(f"Error fetching credentials from API: {e}")
+        logger.error("Error fetching credentials from API: %s", e)
         return None, None, None
 
 
-async def authenticate(participant_name: str, fallback_room_name: str, assistant_name: Optional[str] = None, has_initial_transcripts: bool = False, session_instructions: Optional[str] = None) -> Tuple[str, str, str]:
+async def authenticate(participant_name: str, fallback_room_name: str, assistant_name: Optional[str] = None, has_initial_transcripts: bool = False, session_instructions: Optional[str] = None, http_session: Optional[aiohttp.ClientSession] = None) -> Tuple[str, str, str]:
     """
     Unified authentication function that tries remote API first, then falls back to local token generation.
     
@@ -102,15 +185,16 @@ async def authenticate(participant_name: str, fallback_room_name: str, assistant
                        If multiple assistants with the same name exist, the first one found will be used.
         has_initial_transcripts: Whether the client has initial transcripts to send
         session_instructions: Optional instructions to append to the system prompt for this session only
+        http_session: Optional aiohttp session to use instead of the shared module session
     
     Returns:
         Tuple of (token, room_name, livekit_url)
     """
     # Try to get credentials from auth API first
-    api_token, api_room_name, api_url = await get_credentials_from_api(participant_name, assistant_name, has_initial_transcripts, session_instructions)
+    api_token, api_room_name, api_url = await get_credentials_from_api(participant_name, assistant_name, has_initial_transcripts, session_instructions, http_session=http_session)
     
     if api_token and api_room_name:
-        logger.info(f"Using auth API credentials for room: {api_room_name}")
+        logger.info("Using auth API credentials for room: %s", api_room_name)
         return api_token, api_room_name, api_url or DEFAULT_LIVEKIT_URL
     else:
         raise Exception("Authentication via API failed, please check your device ID and API key")
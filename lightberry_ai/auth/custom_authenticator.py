@@ -6,16 +6,19 @@ Handles authentication with custom LiveKit servers via their token servers.
 
 import aiohttp
 import logging
-from typing import Tuple
+from typing import Optional, Tuple
 from urllib.parse import urlparse
 
+from ._http import session_scope
+
 logger = logging.getLogger(__name__)
 
 
 async def get_token_from_custom_server(
     livekit_url: str,
     participant_name: str,
-    room_name: str = "lightberry"
+    room_name: str = "lightberry",
+    http_session: Optional[aiohttp.ClientSession] = None
 ) -> str:
     """
     Get authentication token from custom LiveKit server's token server.
@@ -27,6 +30,7 @@ async def get_token_from_custom_server(
         livekit_url: The LiveKit WebSocket URL (e.g., "ws://192.168.1.100:7880")
         participant_name: The participant name (identity)
         room_name: The room name to join (defaults to "lightberry")
+        http_session: Optional aiohttp session to reuse instead of opening a new one
     
     Returns:
         Authentication token for the LiveKit server
@@ -51,7 +55,7 @@ async def get_token_from_custom_server(
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
+        async with session_scope(http_session) as session:
             async with session.post(token_server_url, json=payload) as response:
                 response.raise_for_status()
                 data = await response.json()
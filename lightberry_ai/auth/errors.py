@@ -0,0 +1,7 @@
+"""
+Authentication errors for Lightberry SDK
+"""
+
+
+class QuotaExceededError(Exception):
+    """Raised when the auth service reports that the account quota is exhausted."""
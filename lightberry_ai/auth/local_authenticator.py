@@ -6,21 +6,42 @@ Handles authentication with local LiveKit server via token server.
 
 import aiohttp
 import logging
-from typing import Optional, Tuple
+import time
+from typing import Dict, Optional, Tuple
+
+from ._http import session_scope
+from .errors import QuotaExceededError
 
 # Local server configuration
 LOCAL_TOKEN_SERVER_URL = "http://localhost:8090/api/token"
 LOCAL_LIVEKIT_URL = "ws://localhost:7880"
 
+# Tokens are reused within a time window that is well inside their lifetime
+LOCAL_TOKEN_TTL = 600  # seconds
+_TOKEN_CACHE_MAXSIZE = 32
+_token_cache: Dict[Tuple[str, str, int], str] = {}
+
 logger = logging.getLogger(__name__)
 
 
+def invalidate_local_token(token: str) -> None:
+    """
+    Drop a cached local token, e.g. after the LiveKit server rejected it.
+    
+    Args:
+        token: Token previously returned by authenticate_local
+    """
+    for key in [key for key, cached in _token_cache.items() if cached == token]:
+        del _token_cache[key]
+
+
 async def authenticate_local(
     participant_name: str,
     room_name: str,
     assistant_name: Optional[str] = None,  # Ignored in local mode
     has_initial_transcripts: bool = False,  # Ignored in local mode
-    session_instructions: Optional[str] = None  # Ignored in local mode
+    session_instructions: Optional[str] = None,  # Ignored in local mode
+    http_session: Optional[aiohttp.ClientSession] = None
 ) -> Tuple[str, str, str]:
     """
     Authenticate with local LiveKit token server.
@@ -31,11 +52,13 @@ async def authenticate_local(
         assistant_name: Ignored in local mode (server configuration handled separately)
         has_initial_transcripts: Ignored in local mode
         session_instructions: Ignored in local mode
+        http_session: Optional aiohttp session to reuse instead of opening a new one
     
     Returns:
         Tuple of (token, room_name, livekit_url)
     
     Raises:
+        QuotaExceededError: If the token server responds with HTTP 429
         Exception: If authentication fails or token server is not running
     """
     if assistant_name:
@@ -43,14 +66,23 @@ async def authenticate_local(
     
     logger.info(f"Authenticating with local token server for participant: {participant_name}, room: {room_name}")
     
+    # Keying on the current TTL window means a cached token is never older than LOCAL_TOKEN_TTL
+    cache_key = (participant_name, room_name, int(time.time() // LOCAL_TOKEN_TTL))
+    token = _token_cache.get(cache_key)
+    if token:
+        logger.info(f"Reusing cached local token for room: {room_name}")
+        return token, room_name, LOCAL_LIVEKIT_URL
+    
     payload = {
         "room": room_name,
         "identity": participant_name
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
+        async with session_scope(http_session) as session:
             async with session.post(LOCAL_TOKEN_SERVER_URL, json=payload) as response:
+                if response.status == 429:
+                    raise QuotaExceededError("Quota exceeded (HTTP 429)")
                 response.raise_for_status()
                 data = await response.json()
                 
@@ -58,6 +90,10 @@ async def authenticate_local(
                 if not token:
                     raise Exception("Token server did not return a token")
                 
+                if len(_token_cache) >= _TOKEN_CACHE_MAXSIZE:
+                    _token_cache.pop(next(iter(_token_cache)))
+                _token_cache[cache_key] = token
+                
                 logger.info(f"Successfully authenticated with local server for room: {room_name}")
                 return token, room_name, LOCAL_LIVEKIT_URL
                 
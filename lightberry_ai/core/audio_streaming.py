@@ -22,7 +22,6 @@ import termios
 import tty
 import curses
 import json
-from dotenv import load_dotenv
 from signal import SIGINT, SIGTERM
 from livekit import rtc
 from livekit.rtc import apm
@@ -31,7 +30,6 @@ import numpy as np
 from ..auth import authenticate, authenticate_local
 # list_audio_devices not needed in SDK
 
-load_dotenv()
 # ensure LIVEKIT_URL, LIVEKIT_API_KEY, and LIVEKIT_API_SECRET are set in your .env file
 LIVEKIT_URL = os.environ.get("LIVEKIT_URL")
 ROOM_NAME = os.environ.get("ROOM_NAME")
@@ -47,6 +45,9 @@ INPUT_DB_MIN = -70.0
 INPUT_DB_MAX = 0.0
 FPS = 16
 
+# Remote frames below this level are treated as silence
+SILENCE_DB = -65.0
+
 def _esc(*codes: int) -> str:
     return "\033[" + ";".join(str(c) for c in codes) + "m"
 
@@ -342,6 +343,9 @@ class AudioStreamer:
         self.output_lock = threading.Lock()
         self.audio_input_queue = asyncio.Queue(maxsize=30)  # Prevent memory buildup
         
+        # Wall-clock time of the last non-silent remote frame, used to detect end of playback
+        self.last_speech_time = 0.0
+        
         # Timing and delay tracking for AEC
         self.output_delay = 0.0
         self.input_delay = 0.0
@@ -702,6 +706,34 @@ class AudioStreamer:
                         self.logger.warning(f"Error processing reverse stream with AEC: {e}")
                     # Only log this error for the first few callbacks to avoid spam
     
+    async def wait_for_playback_drain(self, timeout: float, quiet_period: float = 0.5) -> bool:
+        """
+        Wait until remote speech has finished playing.
+        
+        Playback counts as finished once speech has been received after this call
+        started, followed by quiet_period of silence plus whatever is still buffered.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            quiet_period: Silence required after the last speech frame
+            
+        Returns:
+            True if playback drained, False if the timeout expired first
+        """
+        loop = asyncio.get_running_loop()
+        started = time.time()
+        deadline = loop.time() + timeout
+        bytes_per_second = SAMPLE_RATE * NUM_CHANNELS * 2
+        
+        while loop.time() < deadline:
+            if self.last_speech_time > started:
+                with self.output_lock:
+                    buffered = len(self.output_buffer) / bytes_per_second
+                if time.time() - self.last_speech_time > quiet_period + buffered:
+                    return True
+            await asyncio.sleep(0.1)
+        return False
+    
     def should_use_terminal_meter(self):
         """Check if we should use terminal meter based on current log level."""
         # Get the effective logging level for our logger
@@ -936,8 +968,9 @@ async def main(participant_name: str, enable_aec: bool = True, initial_transcrip
                     rms = np.sqrt(np.mean(audio_samples.astype(np.float32) ** 2))
                     max_int16 = np.iinfo(np.int16).max
                     participant_db = 20.0 * np.log10(rms / max_int16 + 1e-6)
-                    if participant_db < -65.0: 
+                    if participant_db < SILENCE_DB: 
                         continue # skip silent frames
+                    streamer.last_speech_time = time.time()
                     
                     # Update participant info
                     with streamer.participants_lock:
@@ -947,10 +980,10 @@ async def main(participant_name: str, enable_aec: bool = True, initial_transcrip
                             'last_update': time.time()
                         }
                 
-            # Add received audio to output buffer
-            audio_data = frame_event.frame.data.tobytes()
+            # Add received audio to output buffer, copying straight from the
+            # frame's buffer instead of through an intermediate bytes object
             with streamer.output_lock:
-                streamer.output_buffer.extend(audio_data)
+                streamer.output_buffer.extend(frame_event.frame.data)
         
         logger.info(f"Audio receive task ended for {participant_name}. Total frames received: {frames_received}")
         
@@ -1176,6 +1209,10 @@ async def main(participant_name: str, enable_aec: bool = True, initial_transcrip
         except KeyboardInterrupt:
             logger.info("Stopping audio streaming...")
         
+    except rtc.ConnectError as e:
+        # Surface a rejected join so the client can refresh its credentials
+        logger.error(f"Failed to join room: {e}")
+        raise
     except Exception as e:
         logger.error(f"Error in main: {e}")
         import traceback
@@ -5,19 +5,63 @@ This client provides audio-only streaming functionality using LiveKit infrastruc
 Audio is processed at 48kHz sample rate with optional echo cancellation.
 """
 
+import functools
 import logging
 import os
-from typing import Optional
-from dotenv import load_dotenv
+import threading
+from typing import Optional, Union
 
-# Import the SDK's audio streaming functionality
-from .audio_streaming import main as audio_main
-from ..auth import authenticate, authenticate_local, get_token_from_custom_server
+import aiohttp
 
-load_dotenv()
+from ..auth import (
+    authenticate,
+    authenticate_local,
+    release_auth_session,
+    retain_auth_session,
+    get_token_from_custom_server,
+    QuotaExceededError,
+)
+from ..auth._cache import (
+    cache_credentials,
+    checkout_credentials,
+    invalidate_credentials,
+    release_credentials,
+)
+from ..auth import authenticator
+from ..auth.local_authenticator import invalidate_local_token
 
 logger = logging.getLogger(__name__)
 
+# Level names accepted for log_level, including logging's WARN/FATAL aliases
+_LEVEL_MAP = {name: getattr(logging, name) for name in ("DEBUG", "INFO", "WARNING", "WARN", "ERROR", "CRITICAL", "FATAL")}
+
+_logging_lock = threading.Lock()
+_logging_configured = False
+
+
+def _resolve_log_level(level: Union[str, int]) -> int:
+    """Map a level name such as "info" to its logging constant; ints pass through."""
+    if isinstance(level, int):
+        return level
+    try:
+        return _LEVEL_MAP[level.upper()]
+    except KeyError:
+        raise ValueError(
+            f"Invalid log_level {level!r}; expected one of {', '.join(_LEVEL_MAP)}"
+        ) from None
+
+
+def _configure_logging(level: int) -> None:
+    """Configure root logging once per process; later calls are no-ops."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    with _logging_lock:
+        if _logging_configured:
+            return
+        logging.basicConfig(level=level)
+        _logging_configured = True
+
 
 class LBBasicClient:
     """
@@ -32,13 +76,38 @@ class LBBasicClient:
         use_local: Use local LiveKit server instead of cloud (default: False)
         device_index: Audio device index (None for system default)
         enable_aec: Enable acoustic echo cancellation (default: True)
-        log_level: Logging verbosity level (DEBUG, INFO, WARNING, ERROR)
+        log_level: Logging verbosity level (DEBUG, INFO, WARNING, ERROR) or a logging constant
         assistant_name: Optional assistant name to override configured assistant (testing only)
         initial_transcripts: Optional list of transcript dictionaries to initialize conversation history
         session_instructions: Optional instructions to append to the system prompt for this session only
         livekit_url_override: Optional custom LiveKit server URL (e.g., "ws://192.168.1.100:7880")
+        http_session: Optional aiohttp session for authentication requests; the caller
+            owns it and it is not closed by disconnect()
     """
     
+    __slots__ = (
+        "api_key",
+        "device_id",
+        "use_local",
+        "device_index",
+        "enable_aec",
+        "log_level",
+        "assistant_name",
+        "initial_transcripts",
+        "session_instructions",
+        "livekit_url_override",
+        "http_session",
+        "_default_participant_name",
+        "_default_room_name",
+        "_participant_name",
+        "_room_name",
+        "_token",
+        "_livekit_url",
+        "_holds_auth_session",
+        "_cache_key",
+        "_from_cache",
+    )
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -46,15 +115,17 @@ class LBBasicClient:
         use_local: bool = False,
         device_index: Optional[int] = None,
         enable_aec: bool = True,
-        log_level: str = "WARNING",
+        log_level: Union[str, int] = "WARNING",
         assistant_name: Optional[str] = None,
         initial_transcripts: Optional[list] = None,
         session_instructions: Optional[str] = None,
-        livekit_url_override: Optional[str] = None
+        livekit_url_override: Optional[str] = None,
+        http_session: Optional[aiohttp.ClientSession] = None
     ):
         # Validate required parameters based on mode
         if not use_local and not livekit_url_override and (not api_key or not device_id):
             raise ValueError("api_key and device_id are required for remote mode")
+        level = _resolve_log_level(log_level)
         
         self.api_key = api_key
         self.device_id = device_id if device_id else "local-device"
@@ -66,6 +137,14 @@ class LBBasicClient:
         self.initial_transcripts = initial_transcripts
         self.session_instructions = session_instructions
         self.livekit_url_override = livekit_url_override
+        self.http_session = http_session
+        
+        # Connection defaults; ROOM_NAME only applies to the remote service
+        self._default_participant_name = f"sdk-user-{self.device_id}@{self.device_id}"
+        if use_local or livekit_url_override:
+            self._default_room_name = "lightberry"
+        else:
+            self._default_room_name = os.environ.get("ROOM_NAME", "lightberry")
         
         # Set by authentication
         self._participant_name: Optional[str] = None
@@ -73,9 +152,17 @@ class LBBasicClient:
         self._token: Optional[str] = None
         self._livekit_url: Optional[str] = None
         
+        # Whether this client holds a reference on the shared auth HTTP session
+        self._holds_auth_session = False
+        
+        # Credential cache entry this client holds for its current token, and
+        # whether the token was served from the cache rather than fetched
+        self._cache_key = None
+        self._from_cache = False
+        
         # Configure logging
-        logging.basicConfig(level=getattr(logging, log_level.upper()))
-        logger.info(f"LBBasicClient initialized with AEC: {enable_aec}")
+        _configure_logging(level)
+        logger.info("LBBasicClient initialized with AEC: %s", enable_aec)
         
     async def connect(self, room_name: Optional[str] = None) -> None:
         """
@@ -89,18 +176,27 @@ class LBBasicClient:
             room_name: Room name (defaults to "lightberry" when using custom override)
         
         Raises:
-            Exception: If quota is exceeded, displays "Quota reached." message
+            QuotaExceededError: If quota is exceeded, with a "Quota reached." message
             Exception: If authentication fails for other reasons
         """
-        # Always generate participant name from device_id with @device_id suffix
-        participant_name = f"sdk-user-{self.device_id}@{self.device_id}"
+        # Keep the shared auth session open until this client disconnects; only
+        # the remote API uses it, and only when no session was passed in
+        if not self._holds_auth_session and not self.use_local and self.http_session is None:
+            retain_auth_session()
+            self._holds_auth_session = True
+        
+        # Let go of the credentials from a previous connect before fetching new ones
+        self._release_credentials()
+        
+        # Participant name is derived from device_id (with @device_id suffix) in __init__
+        participant_name = self._default_participant_name
         
         if self.use_local:
             logger.info("Connecting to local LiveKit server...")
             
             # Use provided room name or default to "lightberry"
             if not room_name:
-                room_name = "lightberry"
+                room_name = self._default_room_name
                 
             # Use local authentication
             auth_func = authenticate_local
@@ -109,11 +205,15 @@ class LBBasicClient:
             
             # For remote mode, room name comes from environment or default
             if not self.livekit_url_override:
-                room_name = os.environ.get("ROOM_NAME", "lightberry")
+                room_name = self._default_room_name
             
             # Use remote authentication
             auth_func = authenticate
         
+        # Remote credentials are reused across reconnects; local tokens are
+        # already cached by authenticate_local
+        cache_key = None
+        
         try:
             # If using custom override, we still authenticate with API first
             if self.livekit_url_override and not self.use_local:
@@ -129,14 +229,15 @@ class LBBasicClient:
                     "verification",
                     self.assistant_name,
                     has_initial_transcripts=has_initial_transcripts,
-                    session_instructions=self.session_instructions
+                    session_instructions=self.session_instructions,
+                    http_session=self.http_session
                 )
                 
                 logger.info("API credentials verified successfully")
                 print("✅ API credentials verified")
                 
                 # Step 2: Use custom server with default room "lightberry" if not specified
-                room_name = room_name or "lightberry"
+                room_name = room_name or self._default_room_name
                 print(f"Step 2: Getting token from custom server...")
                 print(f"  Server: {self.livekit_url_override}")
                 print(f"  Room: {room_name}")
@@ -146,7 +247,8 @@ class LBBasicClient:
                 custom_token = await get_token_from_custom_server(
                     self.livekit_url_override,
                     participant_name,
-                    room_name
+                    room_name,
+                    http_session=self.http_session
                 )
                 
                 # Use custom values
@@ -164,14 +266,40 @@ class LBBasicClient:
                 # Normal flow for local or remote mode
                 has_initial_transcripts = self.initial_transcripts is not None
                 
-                token, room_name, livekit_url = await auth_func(
-                    participant_name, 
-                    room_name, 
-                    self.assistant_name,
-                    has_initial_transcripts=has_initial_transcripts,
-                    session_instructions=self.session_instructions
-                )
+                if not self.use_local:
+                    # Keyed on the credentials the auth request actually
+                    # sends, which come from the environment rather than
+                    # from this client's api_key/device_id
+                    cache_key = (
+                        authenticator.LIGHTBERRY_API_KEY,
+                        authenticator.DEVICE_ID,
+                        authenticator.AUTH_API_URL,
+                        participant_name,
+                        room_name,
+                        self.assistant_name,
+                        has_initial_transcripts,
+                        self.session_instructions,
+                    )
+                cached = checkout_credentials(cache_key) if cache_key else None
+                
+                if cached:
+                    token, room_name, livekit_url = cached
+                    logger.info("Reusing cached credentials for room: %s", room_name)
+                else:
+                    token, room_name, livekit_url = await auth_func(
+                        participant_name, 
+                        room_name, 
+                        self.assistant_name,
+                        has_initial_transcripts=has_initial_transcripts,
+                        session_instructions=self.session_instructions,
+                        http_session=self.http_session
+                    )
+                    # Not kept if another connected client holds this key
+                    if cache_key and not cache_credentials(cache_key, (token, room_name, livekit_url)):
+                        cache_key = None
                 
+                self._cache_key = cache_key
+                self._from_cache = cached is not None
                 self._participant_name = participant_name
                 self._room_name = room_name
                 self._token = token
@@ -179,12 +307,16 @@ class LBBasicClient:
                 
                 logger.info(f"Successfully authenticated - Room: {room_name}, Participant: {participant_name}")
             
-        except Exception as e:
-            # Check for quota exceeded (when server side is implemented)
-            if "quota" in str(e).lower():
-                raise Exception("Quota reached.")
-            else:
-                raise e
+        except QuotaExceededError:
+            if cache_key:
+                invalidate_credentials(cache_key)
+            if not self.is_connected:
+                await self._release_auth_session()
+            raise QuotaExceededError("Quota reached.") from None
+        except Exception:
+            if not self.is_connected:
+                await self._release_auth_session()
+            raise
     
     async def enable_audio(self) -> None:
         """
@@ -196,20 +328,52 @@ class LBBasicClient:
         
         Raises:
             RuntimeError: If called before connect()
+            livekit.rtc.ConnectError: If the room cannot be joined, even with fresh credentials
         """
         if not self._participant_name:
             raise RuntimeError("Must call connect() before enable_audio()")
             
         logger.info("Starting audio streaming...")
         
+        # Imported here so that importing the SDK does not load LiveKit,
+        # sounddevice and numpy until audio is actually needed
+        from .audio_streaming import main as audio_main
+        
         # Call the existing main function with our parameters and the token
-        await audio_main(
+        await self._run_audio(functools.partial(
+            audio_main,
             participant_name=self._participant_name,
             enable_aec=self.enable_aec,
-            initial_transcripts=self.initial_transcripts,
-            token=self._token,
-            livekit_url=self._livekit_url
-        )
+            initial_transcripts=self.initial_transcripts
+        ))
+    
+    async def _run_audio(self, run) -> None:
+        """
+        Join the room via ``run(token=..., livekit_url=...)``, retrying once on rejection.
+        
+        A rejected join drops the cached credentials (local tokens included).
+        If the token came from the remote credential cache, fresh credentials
+        are fetched and the join is tried again.
+        """
+        from livekit.rtc import ConnectError
+        
+        try:
+            await run(token=self._token, livekit_url=self._livekit_url)
+            return
+        except ConnectError:
+            if self.use_local:
+                # The local server may have restarted with new keys
+                invalidate_local_token(self._token)
+            if self._cache_key is None:
+                raise
+            invalidate_credentials(self._cache_key)
+            self._release_credentials()
+            if not self._from_cache:
+                raise
+            logger.warning("Joining with cached credentials failed, re-authenticating...")
+        
+        await self.connect()
+        await run(token=self._token, livekit_url=self._livekit_url)
     
     async def disconnect(self) -> None:
         """
@@ -218,12 +382,36 @@ class LBBasicClient:
         Performs cleanup and disconnects from the LiveKit room.
         """
         logger.info("Disconnecting from Lightberry service...")
-        # The main function handles its own cleanup
+        # The main function handles its own cleanup. The credentials stay
+        # cached so that reconnecting skips the auth request
+        self._release_credentials()
+        await self._release_auth_session()
         self._participant_name = None
         self._room_name = None
         self._token = None
         self._livekit_url = None
     
+    def _release_credentials(self) -> None:
+        """Stop holding this client's cached credentials, if it holds any."""
+        if self._cache_key:
+            release_credentials(self._cache_key)
+            self._cache_key = None
+    
+    async def _release_auth_session(self) -> None:
+        """Give up this client's reference on the shared auth session, if it holds one."""
+        if self._holds_auth_session:
+            self._holds_auth_session = False
+            await release_auth_session()
+    
+    async def __aenter__(self) -> "LBBasicClient":
+        """Connect on entering ``async with`` and return the client."""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Disconnect on leaving ``async with``, even if the body raised."""
+        await self.disconnect()
+    
     @property
     def is_connected(self) -> bool:
         """Check if client is connected and ready for streaming."""
@@ -5,16 +5,74 @@ This client provides audio streaming with tool execution capabilities using Live
 data channels for remote tool calls. Tools are defined in local_tool_responses.py.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
-# Import the SDK's tool streaming functionality
-from .tool_streaming import main_with_tools
+import aiohttp
+
+from ..tools._discovery import find_tools_spec
 from .basic_client import LBBasicClient
 
 logger = logging.getLogger(__name__)
 
 
+# Tool map shared by every client in the process once tools have been found
+_loaded_tools: Dict[str, Any] = {}
+
+# Whether the missing-module warning has been logged since tools were last looked up
+_missing_reported = False
+
+
+def _report_missing() -> None:
+    """Warn that there are no tools, once until the lookup result changes."""
+    global _missing_reported
+    if not _missing_reported:
+        _missing_reported = True
+        logger.warning("local_tool_responses.py not found - no tools will be available")
+
+
+def _load_tools_once() -> Dict[str, Any]:
+    """
+    Load tools from local_tool_responses.py.
+    
+    A non-empty result is kept so that every client in the process shares one
+    tool map and the module is only imported once. An empty result is not
+    kept, so tools that become importable later (e.g. after a sys.path or
+    working directory change) are still picked up.
+    
+    Returns:
+        Tool metadata keyed by tool name, or an empty dict if no tools are available
+    """
+    global _loaded_tools, _missing_reported
+    if _loaded_tools:
+        return _loaded_tools
+    
+    # Probe for the module before importing it so a missing file costs
+    # a cached path lookup rather than a failed import
+    if find_tools_spec() is None:
+        _report_missing()
+        return {}
+        
+    try:
+        from local_tool_responses import get_available_tools
+        
+        _missing_reported = False
+        tools = get_available_tools()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Loaded %d tools: %s", len(tools), list(tools))
+        if tools:
+            _loaded_tools = tools
+        return tools
+        
+    except ImportError:
+        _report_missing()
+    except Exception as e:
+        logger.error("Error loading tools: %s", e)
+    return {}
+
+
 class LBToolClient(LBBasicClient):
     """
     Audio streaming client with tool execution support.
@@ -29,13 +87,22 @@ class LBToolClient(LBBasicClient):
         use_local: Use local LiveKit server instead of cloud (default: False)
         device_index: Audio device index (None for system default)
         enable_aec: Enable acoustic echo cancellation (default: True)
-        log_level: Logging verbosity level (DEBUG, INFO, WARNING, ERROR)
+        log_level: Logging verbosity level (DEBUG, INFO, WARNING, ERROR) or a logging constant
         assistant_name: Optional assistant name to override configured assistant (testing only)
         initial_transcripts: Optional list of transcript dictionaries to initialize conversation history
         session_instructions: Optional instructions to append to the system prompt for this session only
         livekit_url_override: Optional custom LiveKit server URL (e.g., "ws://192.168.1.100:7880")
+        max_buffered_delay_ms: Queued tool calls older than this are dropped when a newer
+            identical call (same tool and arguments) is waiting (default: 150)
+        http_session: Optional aiohttp session for authentication requests; the caller
+            owns it and it is not closed by disconnect()
     """
     
+    __slots__ = ("max_buffered_delay_ms",)
+    
+    # Fixed channel name used for tool communication
+    data_channel_name = "tool_calls"
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -43,11 +110,13 @@ class LBToolClient(LBBasicClient):
         use_local: bool = False,
         device_index: Optional[int] = None,
         enable_aec: bool = True,
-        log_level: str = "INFO",
+        log_level: Union[str, int] = "INFO",
         assistant_name: Optional[str] = None,
         initial_transcripts: Optional[list] = None,
         session_instructions: Optional[str] = None,
-        livekit_url_override: Optional[str] = None
+        livekit_url_override: Optional[str] = None,
+        max_buffered_delay_ms: int = 150,
+        http_session: Optional[aiohttp.ClientSession] = None
     ):
         # Call parent constructor with all parameters
         super().__init__(
@@ -60,29 +129,41 @@ class LBToolClient(LBBasicClient):
             assistant_name=assistant_name,
             initial_transcripts=initial_transcripts,
             session_instructions=session_instructions,
-            livekit_url_override=livekit_url_override
+            livekit_url_override=livekit_url_override,
+            http_session=http_session
         )
         
         # Tool-specific configuration
-        self._data_channel_name = "tool_calls"  # Fixed channel name
+        self.max_buffered_delay_ms = max_buffered_delay_ms
         
-        # Load tools from local_tool_responses.py
-        self._load_tools()
+    async def _load_tools_async(self) -> Dict[str, Any]:
+        """
+        Load tools, probing for the module in a worker thread.
+        
+        Only the sys.path scan runs off the event loop. The module itself is
+        imported on this thread, because tool modules may call signal.signal
+        (e.g. rospy.init_node) or create asyncio primitives at import time,
+        and neither works from a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        # find_tools_spec caches its result, so _load_tools_once reuses it
+        await loop.run_in_executor(None, find_tools_spec)
+        return _load_tools_once()
+        
+    async def connect(self, room_name: Optional[str] = None) -> None:
+        """
+        Connect to LiveKit room, loading tools while authentication is in flight.
+        
+        Args:
+            room_name: Room name (defaults to "lightberry" when using custom override)
+        
+        Raises:
+            QuotaExceededError: If quota is exceeded, with a "Quota reached." message
+            Exception: If authentication fails for other reasons
+        """
+        # asyncio.TaskGroup needs Python 3.11; gather gives the same overlap here
+        await asyncio.gather(super().connect(room_name), self._load_tools_async())
         
-    def _load_tools(self):
-        """Load tools from local_tool_responses.py automatically."""
-        try:
-            import local_tool_responses
-            from local_tool_responses import get_available_tools
-            
-            tools = get_available_tools()
-            logger.info(f"Loaded {len(tools)} tools: {list(tools.keys())}")
-            
-        except ImportError:
-            logger.warning("local_tool_responses.py not found - no tools will be available")
-        except Exception as e:
-            logger.error(f"Error loading tools: {e}")
-    
     async def enable_audio(self) -> None:
         """
         Enable bidirectional audio streaming with tool execution support.
@@ -94,24 +175,26 @@ class LBToolClient(LBBasicClient):
         
         Raises:
             RuntimeError: If called before connect()
+            livekit.rtc.ConnectError: If the room cannot be joined, even with fresh credentials
         """
         if not self._participant_name:
             raise RuntimeError("Must call connect() before enable_audio()")
             
         logger.info("Starting audio streaming with tool support...")
         
+        # Resolve tools now rather than at construction time
+        _load_tools_once()
+        
+        # Deferred like the basic client's audio import to keep SDK import light
+        from .tool_streaming import main_with_tools
+        
         # Call the tool streaming function instead of basic audio streaming
-        await main_with_tools(
+        await self._run_audio(functools.partial(
+            main_with_tools,
             participant_name=self._participant_name,
             device_index=self.device_index,
             enable_aec=self.enable_aec,
-            data_channel_name=self._data_channel_name,
+            data_channel_name=self.data_channel_name,
             initial_transcripts=self.initial_transcripts,
-            token=self._token,
-            livekit_url=self._livekit_url
-        )
-    
-    @property
-    def data_channel_name(self) -> str:
-        """Get the data channel name used for tool communication."""
-        return self._data_channel_name
\ No newline at end of file
+            max_buffered_delay_ms=self.max_buffered_delay_ms
+        ))
\ No newline at end of file
@@ -22,22 +22,18 @@ This version adds:
 import os
 import logging
 import asyncio
+import collections
 import json
 import time
 from typing import Optional, Dict, Any
-from dotenv import load_dotenv
 from livekit import rtc
 from ..tools.server import LightberryToolServer  
+from ..tools._discovery import import_tools_module
 from ..auth import authenticate, authenticate_local
 from . import audio_streaming as stream_audio
 
-# Try to import local_tool_responses to set up app controller if available
-try:
-    import local_tool_responses
-except ImportError:
-    local_tool_responses = None
-
-load_dotenv()
+# Import local_tool_responses to set up app controller if available
+local_tool_responses = import_tools_module()
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +43,24 @@ class AppController:
     
     def __init__(self):
         self.disconnect_requested = False
+        self.streamer: Optional[stream_audio.AudioStreamer] = None
         
     def request_disconnect(self):
         """Request the application to disconnect from the room."""
         self.disconnect_requested = True
         logger.info("Disconnect requested by tool")
+        
+    async def wait_for_audio_drain(self, timeout: float) -> bool:
+        """
+        Wait for the assistant's speech to finish playing, up to timeout seconds.
+        
+        Returns:
+            True if playback drained, False if the timeout expired first
+        """
+        if self.streamer is None:
+            await asyncio.sleep(timeout)
+            return False
+        return await self.streamer.wait_for_playback_drain(timeout)
 
 
 class AudioStreamWithTools(stream_audio.AudioStreamer):
@@ -63,6 +72,7 @@ class AudioStreamWithTools(stream_audio.AudioStreamer):
         self.rpc_method_name: str = "tool_call"
         self.tool_channel_name: Optional[str] = None
         self.last_meter_log = 0  # Track last meter log time
+        self.dropped_tool_calls = 0  # Stale tool calls coalesced away
         
     def set_tool_server(self, tool_server: LightberryToolServer):
         """Set the tool server instance."""
@@ -151,7 +161,8 @@ async def main_with_tools(
     initial_transcripts: Optional[list] = None,
     token: Optional[str] = None,
     livekit_url: Optional[str] = None,
-    use_local: bool = False
+    use_local: bool = False,
+    max_buffered_delay_ms: int = 150
 ):
     """
     Main function with tool support via data channel.
@@ -161,6 +172,8 @@ async def main_with_tools(
         device_index: Audio device index to use
         enable_aec: Whether to enable echo cancellation
         data_channel_name: Name of the data channel for tool calls
+        max_buffered_delay_ms: Queued tool calls older than this are dropped when a
+            newer identical call (same tool and arguments) is waiting behind them
     """
     # Create app controller for tool-based application control
     app_controller = AppController()
@@ -169,6 +182,7 @@ async def main_with_tools(
     
     # Create extended audio streamer with modified AEC settings for better voice pickup
     streamer = AudioStreamWithTools(enable_aec=enable_aec)
+    app_controller.streamer = streamer
     
     # If AEC is enabled, try less aggressive settings for better voice pickup
     if enable_aec and streamer.audio_processor:
@@ -207,7 +221,7 @@ async def main_with_tools(
     async def handle_tool_call(rpc_data):
         """Handle tool call via RPC."""
         try:
-            # Parse the tool call to extract name and args for printing
+            # Parse the tool call once; it is used for printing and for execution
             try:
                 tool_call = json.loads(rpc_data.payload)
                 tool_name = tool_call.get("name", "unknown")
@@ -216,11 +230,16 @@ async def main_with_tools(
                 args.pop("name", None)
                 print(f"Tool call received: name: {tool_name} args: {args}")
             except:
+                tool_call = None
                 print(f"Tool call received: name: unknown args: {rpc_data.payload}")
             
             if streamer.tool_server:
-                # Process the tool call
-                response = await streamer.tool_server.process_tool_call(rpc_data.payload)
+                # Process the tool call; malformed payloads go through the string
+                # path so the server builds the usual error response
+                if tool_call is None:
+                    response = await streamer.tool_server.process_tool_call(rpc_data.payload)
+                else:
+                    response = await streamer.tool_server.process_tool_call_dict(tool_call)
                 return json.dumps(response)
             else:
                 logger.warning("Tool server not configured, ignoring tool call")
@@ -230,6 +249,44 @@ async def main_with_tools(
             logger.error(f"Error handling tool call: {e}")
             return json.dumps({"error": str(e)})
     
+    # Tool calls received on the data channel, as (queued_at, call_key, payload)
+    pending_tool_calls: collections.deque = collections.deque()
+    tool_calls_ready = asyncio.Event()
+    
+    async def execute_tool_call(tool_call_payload: Dict[str, Any]):
+        """Run one queued tool call through the tool server."""
+        try:
+            response = await streamer.tool_server.process_tool_call_dict(tool_call_payload)
+            logger.info(f"Tool call processed: {response}")
+        except Exception as e:
+            logger.error(f"Error processing tool call: {e}")
+    
+    async def tool_call_dispatch_task():
+        """
+        Drain queued tool calls, coalescing stale ones.
+        
+        When the event loop falls behind, calls pile up in the queue. A call that
+        has waited longer than max_buffered_delay_ms is dropped only if an
+        identical call (same tool, same arguments) is queued after it; calls
+        with different arguments are always executed.
+        """
+        max_delay = max_buffered_delay_ms / 1000.0
+        while streamer.running:
+            await tool_calls_ready.wait()
+            tool_calls_ready.clear()
+            
+            now = time.monotonic()
+            latest = {entry[1]: entry for entry in pending_tool_calls}
+            while pending_tool_calls:
+                entry = pending_tool_calls.popleft()
+                queued_at, call_key, tool_call_payload = entry
+                if now - queued_at > max_delay and latest[call_key] is not entry:
+                    streamer.dropped_tool_calls += 1
+                    logger.warning(f"Dropping stale duplicate {call_key[0]} call")
+                    continue
+                # Fire and forget - don't block on tool execution
+                asyncio.create_task(execute_tool_call(tool_call_payload))
+    
     # Define data channel handler for tool calls
     def handle_data_channel_message(data: bytes, topic: str):
         """Handle data channel messages."""
@@ -248,45 +305,16 @@ async def main_with_tools(
                 
                 # Process the tool call if it's in executing status
                 if status == "executing" and streamer.tool_server:
-                    # Track processed calls to avoid duplicates
-                    if not hasattr(streamer, 'processed_calls'):
-                        streamer.processed_calls = set()
-                    
-                    # Create a unique call ID from tool name and timestamp
-                    call_id = f"{tool_name}_{time.time()}"
-                    
-                    # Check if we've recently processed this tool
-                    recent_calls = [c for c in streamer.processed_calls if c.startswith(tool_name)]
-                    if recent_calls:
-                        # Check if any recent call was within 1 second
-                        for recent in recent_calls:
-                            try:
-                                _, timestamp = recent.rsplit('_', 1)
-                                if time.time() - float(timestamp) < 1.0:
-                                    print(f"⚠️ Ignoring duplicate {tool_name} call within 1 second")
-                                    continue
-                            except:
-                                pass
-                    
-                    streamer.processed_calls.add(call_id)
-                    
-                    # Convert to the format expected by our tool server
+                    # Convert to the format expected by our tool server and queue it;
+                    # tool_call_dispatch_task executes it without blocking audio processing
                     tool_call_payload = {
                         "name": tool_name,
                         **arguments
                     }
-                    
-                    # Process in background WITHOUT blocking audio processing
-                    async def process_async():
-                        try:
-                            response = await streamer.tool_server.process_tool_call(json.dumps(tool_call_payload))
-                            logger.info(f"Tool call processed: {response}")
-                        except Exception as e:
-                            logger.error(f"Error processing tool call: {e}")
-                    
-                    # Fire and forget - don't block on tool execution
-                    asyncio.create_task(process_async())
-                    print(f"✓ Tool {tool_name} execution started (non-blocking)")
+                    call_key = (tool_name, json.dumps(arguments, sort_keys=True, default=str))
+                    pending_tool_calls.append((time.monotonic(), call_key, tool_call_payload))
+                    tool_calls_ready.set()
+                    print(f"✓ Tool {tool_name} queued for execution (non-blocking)")
                 
                 elif status == "completed":
                     print(f"✓ Tool call {tool_name} marked as completed by agent")
@@ -503,6 +531,8 @@ async def main_with_tools(
                 rms = stream_audio.np.sqrt(stream_audio.np.mean(frame_data.astype(stream_audio.np.float32) ** 2))
                 max_int16 = stream_audio.np.iinfo(stream_audio.np.int16).max
                 db_level = 20.0 * stream_audio.np.log10(rms / max_int16 + 1e-6)
+                if db_level >= stream_audio.SILENCE_DB:
+                    streamer.last_speech_time = stream_audio.time.time()
                 
                 with streamer.participants_lock:
                     if participant.sid in streamer.participants:
@@ -510,9 +540,9 @@ async def main_with_tools(
                         streamer.participants[participant.sid]['last_update'] = stream_audio.time.time()
                 
                 # IMPORTANT: Add received audio to output buffer for playback
-                audio_data = event.frame.data.tobytes()
+                # (extend copies straight from the frame's memoryview)
                 with streamer.output_lock:
-                    streamer.output_buffer.extend(audio_data)
+                    streamer.output_buffer.extend(event.frame.data)
     
     try:
         # Start tool server
@@ -571,6 +601,8 @@ async def main_with_tools(
         publication = await room.local_participant.publish_track(track, options)
         logger.info("published track %s", publication.sid)
         
+        tool_dispatch_task = asyncio.create_task(tool_call_dispatch_task())
+        
         # IMPORTANT: Start audio processing task BEFORE starting audio devices
         logger.info("Starting audio processing task...")
         audio_task = asyncio.create_task(audio_processing_task())
@@ -599,6 +631,10 @@ async def main_with_tools(
         except KeyboardInterrupt:
             logger.info("Stopping audio streaming...")
             
+    except rtc.ConnectError as e:
+        # Surface a rejected join so the client can refresh its credentials
+        logger.error(f"Failed to join room: {e}")
+        raise
     except Exception as e:
         logger.error(f"Error in main: {e}")
         import traceback
@@ -611,6 +647,16 @@ async def main_with_tools(
         # Stop tool server
         await tool_server.stop()
         
+        if 'tool_dispatch_task' in locals():
+            tool_dispatch_task.cancel()
+            try:
+                await tool_dispatch_task
+            except asyncio.CancelledError:
+                pass
+        pending_tool_calls.clear()
+        if streamer.dropped_tool_calls:
+            logger.info(f"Dropped {streamer.dropped_tool_calls} stale tool calls this session")
+        
         if 'audio_task' in locals():
             audio_task.cancel()
             try:
@@ -0,0 +1,53 @@
+"""
+Discovery of the user's local_tool_responses module
+
+Tools live in a top-level local_tool_responses.py next to the application,
+which is usually absent. Probing for it with find_spec and caching the result
+avoids a failing import (and its sys.path scan) every time the SDK looks.
+"""
+
+import functools
+import importlib
+import importlib.util
+import os
+import sys
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Optional, Tuple
+
+TOOLS_MODULE = "local_tool_responses"
+
+
+@functools.lru_cache(maxsize=8)
+def _tools_spec(path_key: Tuple[Tuple[str, ...], str]) -> Optional[ModuleSpec]:
+    """Find the tools module spec; path_key only scopes the cached result."""
+    return importlib.util.find_spec(TOOLS_MODULE)
+
+
+def find_tools_spec() -> Optional[ModuleSpec]:
+    """
+    Look up local_tool_responses without importing it.
+    
+    Returns:
+        The module spec, or None if the module cannot be found from the
+        current sys.path and working directory
+    """
+    return _tools_spec((tuple(sys.path), os.getcwd()))
+
+
+def import_tools_module() -> Optional[ModuleType]:
+    """
+    Import local_tool_responses if it exists.
+    
+    Returns:
+        The imported module, or None if it is absent or fails to import
+    """
+    module = sys.modules.get(TOOLS_MODULE)
+    if module is not None:
+        return module
+    if find_tools_spec() is None:
+        return None
+    try:
+        return importlib.import_module(TOOLS_MODULE)
+    except ImportError:
+        return None
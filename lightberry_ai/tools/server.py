@@ -11,11 +11,14 @@ import logging
 from typing import Any, Dict, Optional, Callable
 from datetime import datetime
 
+from ._discovery import import_tools_module
+
 # Import the tool registry from local_tool_responses
-try:
-    import local_tool_responses
-    from local_tool_responses import TOOL_REGISTRY, get_available_tools
-except ImportError:
+local_tool_responses = import_tools_module()
+if local_tool_responses is not None:
+    TOOL_REGISTRY = local_tool_responses.TOOL_REGISTRY
+    get_available_tools = local_tool_responses.get_available_tools
+else:
     # If local_tool_responses is not available, create empty registry
     TOOL_REGISTRY = {}
     def get_available_tools():
@@ -52,6 +55,7 @@ class LightberryToolServer:
         
     def _load_tools(self):
         """Load all available tools from the registry."""
+        # get_available_tools() also registers tools declared with @tool
         tools = get_available_tools()
         logger.info(f"Loaded {len(tools)} tools: {list(tools.keys())}")
         
@@ -82,6 +86,23 @@ class LightberryToolServer:
         try:
             # Parse the JSON message
             tool_call = json.loads(message)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in tool call: {e}")
+            return self._error_response("Invalid JSON format", str(e))
+            
+        return await self.process_tool_call_dict(tool_call)
+        
+    async def process_tool_call_dict(self, tool_call: Any) -> Dict[str, Any]:
+        """
+        Process a tool call that has already been decoded from JSON.
+        
+        Args:
+            tool_call: The decoded tool call, expected to be a dict
+            
+        Returns:
+            Dictionary containing the result or error
+        """
+        try:
             logger.debug(f"Received tool call: {tool_call}")
             
             # Validate the tool call structure
@@ -109,10 +130,6 @@ class LightberryToolServer:
             
             return response
             
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in tool call: {e}")
-            return self._error_response("Invalid JSON format", str(e))
-            
         except Exception as e:
             logger.error(f"Error processing tool call: {e}")
             return self._error_response("Tool execution failed", str(e))
@@ -167,8 +184,12 @@ class LightberryToolServer:
             
         tool_func = TOOL_REGISTRY[tool_name]
         
-        # Check if the tool is async
-        if asyncio.iscoroutinefunction(tool_func):
+        # Check if the tool is async; registries may hold Tool objects that
+        # report this themselves because they wrap the function
+        is_coroutine = getattr(tool_func, "is_coroutine", None)
+        if is_coroutine is None:
+            is_coroutine = asyncio.iscoroutinefunction(tool_func)
+        if is_coroutine:
             result = await tool_func(**args)
         else:
             # Run sync functions in thread pool to avoid blocking